@@ -8,6 +8,7 @@ import {
   listMemoryFiles,
   normalizeExtraMemoryPaths,
   remapChunkLines,
+  selectTopKByScore,
 } from "./internal.js";
 
 function setupTempDirLifecycle(prefix: string): () => string {
@@ -230,3 +231,27 @@ describe("remapChunkLines", () => {
     }
   });
 });
+
+describe("selectTopKByScore", () => {
+  it("returns the k highest scores in descending order", () => {
+    const items = [3, 9, 1, 7, 5, 8, 2, 6, 4, 0];
+    const result = selectTopKByScore(items, 3, (n) => n);
+    expect(result).toEqual([9, 8, 7]);
+  });
+
+  it("matches a full sort for random inputs", () => {
+    const items = Array.from({ length: 200 }, (_, i) => ({ id: i, score: (i * 7919) % 211 }));
+    const expected = items.toSorted((a, b) => b.score - a.score).slice(0, 10);
+    const result = selectTopKByScore(items, 10, (item) => item.score);
+    expect(result.map((item) => item.score)).toEqual(expected.map((item) => item.score));
+  });
+
+  it("returns all items sorted when k exceeds input length", () => {
+    const result = selectTopKByScore([1, 3, 2], 10, (n) => n);
+    expect(result).toEqual([3, 2, 1]);
+  });
+
+  it("returns an empty array for non-positive k", () => {
+    expect(selectTopKByScore([1, 2, 3], 0, (n) => n)).toEqual([]);
+  });
+});
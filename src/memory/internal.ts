@@ -315,6 +315,47 @@ export function cosineSimilarity(a: number[], b: number[]): number {
   return dot / (Math.sqrt(normA) * Math.sqrt(normB));
 }
 
+/**
+ * Select the `k` highest-scoring entries in descending score order without
+ * sorting the whole input.  Keeps a bounded, sorted selection and inserts via
+ * binary search — O(n log k) instead of O(n log n), which matters when a
+ * brute-force scan scores every chunk in the store but only `limit` survive.
+ */
+export function selectTopKByScore<T>(items: T[], k: number, score: (item: T) => number): T[] {
+  if (k <= 0 || items.length === 0) {
+    return [];
+  }
+  if (items.length <= k) {
+    return items.toSorted((a, b) => score(b) - score(a));
+  }
+  const selected: T[] = [];
+  const scores: number[] = [];
+  for (const item of items) {
+    const value = score(item);
+    if (selected.length === k && value <= (scores[k - 1] ?? -Infinity)) {
+      continue;
+    }
+    // Binary search for the insertion point (descending order).
+    let lo = 0;
+    let hi = selected.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if ((scores[mid] ?? -Infinity) >= value) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    selected.splice(lo, 0, item);
+    scores.splice(lo, 0, value);
+    if (selected.length > k) {
+      selected.pop();
+      scores.pop();
+    }
+  }
+  return selected;
+}
+
 export async function runWithConcurrency<T>(
   tasks: Array<() => Promise<T>>,
   limit: number,
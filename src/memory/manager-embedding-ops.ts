@@ -31,6 +31,7 @@ const EMBEDDING_RETRY_BASE_DELAY_MS = 500;
 const EMBEDDING_RETRY_MAX_DELAY_MS = 8000;
 const BATCH_FAILURE_LIMIT = 2;
 const EMBEDDING_QUERY_TIMEOUT_REMOTE_MS = 60_000;
+const QUERY_EMBEDDING_CACHE_MAX_ENTRIES = 64;
 const EMBEDDING_QUERY_TIMEOUT_LOCAL_MS = 5 * 60_000;
 const EMBEDDING_BATCH_TIMEOUT_REMOTE_MS = 2 * 60_000;
 const EMBEDDING_BATCH_TIMEOUT_LOCAL_MS = 10 * 60_000;
@@ -545,17 +546,39 @@ export abstract class MemoryManagerEmbeddingOps extends MemoryManagerSyncOps {
     return isLocal ? EMBEDDING_BATCH_TIMEOUT_LOCAL_MS : EMBEDDING_BATCH_TIMEOUT_REMOTE_MS;
   }
 
+  // Repeated interactive queries are common; avoid re-embedding identical text.
+  // Keyed per provider/model/key so provider switches never serve stale vectors.
+  private readonly queryEmbeddingCache = new Map<string, number[]>();
+
   protected async embedQueryWithTimeout(text: string): Promise<number[]> {
     if (!this.provider) {
       throw new Error("Cannot embed query in FTS-only mode (no embedding provider)");
     }
+    const cacheKey = `${this.provider.id}:${this.provider.model}:${this.providerKey}:${text}`;
+    const cached = this.queryEmbeddingCache.get(cacheKey);
+    if (cached) {
+      // Refresh LRU position.
+      this.queryEmbeddingCache.delete(cacheKey);
+      this.queryEmbeddingCache.set(cacheKey, cached);
+      return cached;
+    }
     const timeoutMs = this.resolveEmbeddingTimeout("query");
     log.debug("memory embeddings: query start", { provider: this.provider.id, timeoutMs });
-    return await this.withTimeout(
+    const embedding = await this.withTimeout(
       this.provider.embedQuery(text),
       timeoutMs,
       `memory embeddings query timed out after ${Math.round(timeoutMs / 1000)}s`,
     );
+    if (embedding.length > 0) {
+      this.queryEmbeddingCache.set(cacheKey, embedding);
+      if (this.queryEmbeddingCache.size > QUERY_EMBEDDING_CACHE_MAX_ENTRIES) {
+        const oldest = this.queryEmbeddingCache.keys().next().value;
+        if (oldest !== undefined) {
+          this.queryEmbeddingCache.delete(oldest);
+        }
+      }
+    }
+    return embedding;
   }
 
   protected async withTimeout<T>(
@@ -1,6 +1,6 @@
 import type { DatabaseSync } from "node:sqlite";
 import { truncateUtf16Safe } from "../utils.js";
-import { cosineSimilarity, parseEmbedding } from "./internal.js";
+import { cosineSimilarity, parseEmbedding, selectTopKByScore } from "./internal.js";
 
 const vectorToBlob = (embedding: number[]): Buffer =>
   Buffer.from(new Float32Array(embedding).buffer);
@@ -79,18 +79,16 @@ export async function searchVector(params: {
       score: cosineSimilarity(params.queryVec, chunk.embedding),
     }))
     .filter((entry) => Number.isFinite(entry.score));
-  return scored
-    .toSorted((a, b) => b.score - a.score)
-    .slice(0, params.limit)
-    .map((entry) => ({
-      id: entry.chunk.id,
-      path: entry.chunk.path,
-      startLine: entry.chunk.startLine,
-      endLine: entry.chunk.endLine,
-      score: entry.score,
-      snippet: truncateUtf16Safe(entry.chunk.text, params.snippetMaxChars),
-      source: entry.chunk.source,
-    }));
+  // Brute-force fallback scores every chunk; avoid a full sort for the top-k.
+  return selectTopKByScore(scored, params.limit, (entry) => entry.score).map((entry) => ({
+    id: entry.chunk.id,
+    path: entry.chunk.path,
+    startLine: entry.chunk.startLine,
+    endLine: entry.chunk.endLine,
+    score: entry.score,
+    snippet: truncateUtf16Safe(entry.chunk.text, params.snippetMaxChars),
+    source: entry.chunk.source,
+  }));
 }
 
 export function listChunks(params: {
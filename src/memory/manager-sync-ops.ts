@@ -748,6 +748,33 @@ export abstract class MemoryManagerSyncOps {
         }
         return;
       }
+      // Cheap staleness gate: if the on-disk stat still matches the indexed
+      // mtime+size, skip reading and re-extracting the transcript entirely.
+      if (!params.needsFullReindex) {
+        const indexed = this.db
+          .prepare(`SELECT mtime, size FROM files WHERE path = ? AND source = ?`)
+          .get(sessionPathForFile(absPath), "sessions") as
+          | { mtime: number; size: number }
+          | undefined;
+        if (indexed) {
+          try {
+            const stat = await fs.stat(absPath);
+            if (stat.mtimeMs === indexed.mtime && stat.size === indexed.size) {
+              this.resetSessionDelta(absPath, stat.size);
+              if (params.progress) {
+                params.progress.completed += 1;
+                params.progress.report({
+                  completed: params.progress.completed,
+                  total: params.progress.total,
+                });
+              }
+              return;
+            }
+          } catch {
+            // Fall through to the full read; buildSessionEntry handles errors.
+          }
+        }
+      }
       const entry = await buildSessionEntry(absPath);
       if (!entry) {
         if (params.progress) {
@@ -18,7 +18,7 @@ import {
 } from "./embeddings.js";
 import { isFileMissingError, statRegularFile } from "./fs-utils.js";
 import { bm25RankToScore, buildFtsQuery, mergeHybridResults } from "./hybrid.js";
-import { isMemoryPath, normalizeExtraMemoryPaths } from "./internal.js";
+import { isMemoryPath, normalizeExtraMemoryPaths, selectTopKByScore } from "./internal.js";
 import { MemoryManagerEmbeddingOps } from "./manager-embedding-ops.js";
 import { searchKeyword, searchVector } from "./manager-search.js";
 import { extractKeywords } from "./query-expansion.js";
@@ -281,19 +281,26 @@ export class MemoryIndexManager extends MemoryManagerEmbeddingOps implements Mem
         }
       }
 
-      const merged = [...seenIds.values()]
-        .toSorted((a, b) => b.score - a.score)
-        .filter((entry) => entry.score >= minScore)
-        .slice(0, maxResults);
+      // Top-K selection instead of a full sort: the merged candidate set can be
+      // far larger than maxResults when many keywords match.
+      const merged = selectTopKByScore(
+        [...seenIds.values()].filter((entry) => entry.score >= minScore),
+        maxResults,
+        (entry) => entry.score,
+      );
 
       return merged;
     }
 
+    // The query embedding is the slow leg (often a remote HTTP round-trip) and
+    // its request is dispatched before the first await; run the synchronous FTS
+    // keyword query while it is in flight.
+    const embedPromise = this.embedQueryWithTimeout(cleaned);
     const keywordResults = hybrid.enabled
       ? await this.searchKeyword(cleaned, candidates).catch(() => [])
       : [];
 
-    const queryVec = await this.embedQueryWithTimeout(cleaned);
+    const queryVec = await embedPromise;
     const hasVector = queryVec.some((v) => v !== 0);
     const vectorResults = hasVector
       ? await this.searchVector(queryVec, candidates).catch(() => [])
@@ -630,6 +630,18 @@ const STOP_WORDS_ZH = new Set([
   "告诉",
 ]);
 
+// Union of all per-language stop-word sets, built once at module scope so the
+// per-token check in extractKeywords is a single Set lookup.
+const STOP_WORDS_ALL = new Set([
+  ...STOP_WORDS_EN,
+  ...STOP_WORDS_ES,
+  ...STOP_WORDS_PT,
+  ...STOP_WORDS_AR,
+  ...STOP_WORDS_ZH,
+  ...STOP_WORDS_KO,
+  ...STOP_WORDS_JA,
+]);
+
 /**
  * Check if a token looks like a meaningful keyword.
  * Returns false for short tokens, numbers-only, etc.
@@ -726,16 +738,8 @@ export function extractKeywords(query: string): string[] {
   const seen = new Set<string>();
 
   for (const token of tokens) {
-    // Skip stop words
-    if (
-      STOP_WORDS_EN.has(token) ||
-      STOP_WORDS_ES.has(token) ||
-      STOP_WORDS_PT.has(token) ||
-      STOP_WORDS_AR.has(token) ||
-      STOP_WORDS_ZH.has(token) ||
-      STOP_WORDS_KO.has(token) ||
-      STOP_WORDS_JA.has(token)
-    ) {
+    // Skip stop words (single lookup against the merged per-language sets)
+    if (STOP_WORDS_ALL.has(token)) {
       continue;
     }
     // Skip invalid keywords
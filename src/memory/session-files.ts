@@ -1,5 +1,7 @@
+import fsSync from "node:fs";
 import fs from "node:fs/promises";
 import path from "node:path";
+import readline from "node:readline";
 import { resolveSessionTranscriptsDirForAgent } from "../config/sessions/paths.js";
 import { redactSensitiveText } from "../logging/redact.js";
 import { createSubsystemLogger } from "../logging/subsystem.js";
@@ -7,6 +9,11 @@ import { hashText } from "./internal.js";
 
 const log = createSubsystemLogger("memory");
 
+const NON_WHITESPACE_RE = /\S/;
+// Hoisted: normalizeSessionText runs per text block for every transcript line.
+const NEWLINE_RUN_RE = /\s*\n+\s*/g;
+const WHITESPACE_RUN_RE = /\s+/g;
+
 export type SessionFileEntry = {
   path: string;
   absPath: string;
@@ -37,10 +44,7 @@ export function sessionPathForFile(absPath: string): string {
 }
 
 function normalizeSessionText(value: string): string {
-  return value
-    .replace(/\s*\n+\s*/g, " ")
-    .replace(/\s+/g, " ")
-    .trim();
+  return value.replace(NEWLINE_RUN_RE, " ").replace(WHITESPACE_RUN_RE, " ").trim();
 }
 
 export function extractSessionText(content: unknown): string | null {
@@ -74,13 +78,17 @@ export function extractSessionText(content: unknown): string | null {
 export async function buildSessionEntry(absPath: string): Promise<SessionFileEntry | null> {
   try {
     const stat = await fs.stat(absPath);
-    const raw = await fs.readFile(absPath, "utf-8");
-    const lines = raw.split("\n");
     const collected: string[] = [];
     const lineMap: number[] = [];
-    for (let jsonlIdx = 0; jsonlIdx < lines.length; jsonlIdx++) {
-      const line = lines[jsonlIdx];
-      if (!line.trim()) {
+    // Stream line-at-a-time instead of buffering the whole transcript: session
+    // files grow to many MB and only the extracted text blocks are kept.
+    const input = fsSync.createReadStream(absPath, { encoding: "utf-8" });
+    const reader = readline.createInterface({ input, crlfDelay: Infinity });
+    let jsonlIdx = -1;
+    for await (const line of reader) {
+      jsonlIdx += 1;
+      // Avoid trim()'s per-line string allocation just to test for blankness.
+      if (line.length === 0 || !NON_WHITESPACE_RE.test(line)) {
         continue;
       }
       let record: unknown;